@@ -0,0 +1,39 @@
+"""
+JSON helpers that use orjson when available and fall back to the stdlib.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - exercised only without orjson
+    import json
+
+    HAS_ORJSON = False
+
+
+if HAS_ORJSON:
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON bytes."""
+        # Non-str keys (e.g. int token ids in logit_bias) are stringified, as
+        # the stdlib json module does.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(data: Any) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return orjson.loads(data)
+
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(data: Any) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return json.loads(data)
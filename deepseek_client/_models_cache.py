@@ -0,0 +1,113 @@
+"""
+On-disk cache for the model catalog returned by ``list_models``.
+
+The catalog is stored at ``~/.deepseek-client/models.json`` (or the path in
+``DEEPSEEK_MODELS_PATH``) next to a ``.last_sync`` marker whose mtime records
+the last successful fetch. Setting ``DEEPSEEK_DISABLE_REMOTE_MODELS`` serves
+the catalog from disk only.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import _json
+
+MODELS_TTL = 24 * 60 * 60
+
+
+def models_cache_path() -> Path:
+    """Return the path of the cached model catalog."""
+    override = os.getenv("DEEPSEEK_MODELS_PATH")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".deepseek-client" / "models.json"
+
+
+def remote_models_disabled() -> bool:
+    """Return True if fetching the model catalog over the network is disabled."""
+    return os.getenv("DEEPSEEK_DISABLE_REMOTE_MODELS", "").lower() in ("1", "true", "yes")
+
+
+def _marker(path: Path) -> Path:
+    return path.with_name(".last_sync")
+
+
+def is_fresh(path: Path) -> bool:
+    """Return True if the catalog was synced within the TTL."""
+    try:
+        return os.path.getmtime(_marker(path)) > time.time() - MODELS_TTL
+    except OSError:
+        return False
+
+
+def _read(path: Path, base_url: str) -> Optional[Dict[str, Any]]:
+    try:
+        cached = _json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("base_url") != base_url:
+        return None
+    return cached
+
+
+def read_models(path: Path, base_url: str) -> Optional[List[Dict[str, Any]]]:
+    """Read the cached catalog for a base URL.
+
+    Args:
+        path (Path): Cache file path.
+        base_url (str): API base URL the catalog was fetched from.
+
+    Returns:
+        Optional[List[Dict[str, Any]]]: Cached models, or None if unavailable.
+    """
+    cached = _read(path, base_url)
+    return None if cached is None else cached.get("data", [])
+
+
+def read_capabilities(path: Path, base_url: str) -> Optional[Dict[str, Any]]:
+    """Read server capabilities recorded alongside the cached catalog.
+
+    Args:
+        path (Path): Cache file path.
+        base_url (str): API base URL the catalog was fetched from.
+
+    Returns:
+        Optional[Dict[str, Any]]: Recorded capabilities, or None if never probed.
+    """
+    cached = _read(path, base_url)
+    return None if cached is None else cached.get("capabilities")
+
+
+def write_models(
+    path: Path,
+    base_url: str,
+    models: List[Dict[str, Any]],
+    capabilities: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Atomically write the catalog and refresh the sync marker.
+
+    Failures are ignored so that an unwritable cache never breaks ``list_models``.
+
+    Args:
+        path (Path): Cache file path.
+        base_url (str): API base URL the catalog was fetched from.
+        models (List[Dict[str, Any]]): Models to cache.
+        capabilities (Optional[Dict[str, Any]]): Probed server capabilities. Previously
+            recorded capabilities are kept when omitted.
+    """
+    if capabilities is None:
+        capabilities = read_capabilities(path, base_url)
+    cached = {"base_url": base_url, "data": models}
+    if capabilities is not None:
+        cached["capabilities"] = capabilities
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(_json.dumps(cached))
+        os.replace(tmp, path)
+        _marker(path).touch()
+    except OSError:
+        pass
@@ -0,0 +1,134 @@
+"""
+Helpers for building completion request payloads.
+"""
+
+import gzip
+from typing import Any, Dict, Optional, Tuple
+
+from . import _json
+
+# Optional parameters are only added to the request body when they differ
+# from the API's own defaults. max_tokens is always sent: the client default
+# (1024) differs from the server's.
+DEFAULT_TOP_P = 1.0
+DEFAULT_PRESENCE_PENALTY = 0.0
+
+# Accepted (inclusive) ranges for sampling parameters, checked before sending
+# so that invalid values fail fast instead of costing a round trip.
+VALID_RANGES = {
+    "temperature": (0.0, 2.0),
+    "top_p": (0.0, 1.0),
+    "presence_penalty": (-2.0, 2.0),
+}
+
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+# Bodies at or below this size are sent uncompressed; gzip would cost more
+# CPU than it saves on the wire.
+COMPRESSION_MIN_SIZE = 1024
+
+
+def check_range(name: str, value: float) -> None:
+    """Validate a sampling parameter against its accepted range.
+
+    Args:
+        name (str): Parameter name, a key of ``VALID_RANGES``.
+        value (float): Value to check.
+
+    Raises:
+        ValueError: If the value is outside the accepted range.
+    """
+    lo, hi = VALID_RANGES[name]
+    if not lo <= value <= hi:
+        label = name.replace("_", " ").capitalize()
+        raise ValueError(f"{label} must be between {lo} and {hi}")
+
+
+def build_payload(
+    base: Dict[str, Any],
+    top_p: float,
+    presence_penalty: float,
+    stream: bool,
+    kwargs: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Add non-default optional parameters and extra API arguments to a payload.
+
+    Args:
+        base (Dict[str, Any]): Payload holding the always-sent fields; updated in place.
+        top_p (float): Nucleus sampling threshold.
+        presence_penalty (float): Repetition penalty.
+        stream (bool): Enable streaming response.
+        kwargs (Dict[str, Any]): Additional keyword arguments to pass to the API.
+
+    Returns:
+        Dict[str, Any]: The request payload.
+    """
+    if top_p != DEFAULT_TOP_P:
+        base["top_p"] = top_p
+    if presence_penalty != DEFAULT_PRESENCE_PENALTY:
+        base["presence_penalty"] = presence_penalty
+    if stream:
+        base["stream"] = stream
+    if kwargs:
+        base.update(kwargs)
+    return base
+
+
+def load_msgpack() -> Any:
+    """Import the optional msgpack package.
+
+    Raises:
+        ImportError: If msgpack is not installed.
+    """
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(
+            "wire_format='msgpack' requires msgpack. Install it with "
+            "'pip install deepseek-client-python[msgpack]'."
+        ) from e
+    return msgpack
+
+
+def encode_body(
+    payload: Dict[str, Any], compress: bool = False, use_msgpack: bool = False
+) -> Tuple[bytes, Optional[Dict[str, str]]]:
+    """Serialize a payload, gzip-compressing large bodies when enabled.
+
+    Args:
+        payload (Dict[str, Any]): Request payload.
+        compress (bool): Compress bodies larger than ``COMPRESSION_MIN_SIZE``.
+        use_msgpack (bool): Encode as msgpack instead of JSON.
+
+    Returns:
+        Tuple[bytes, Optional[Dict[str, str]]]: Request body and any extra headers.
+    """
+    headers = None
+    if use_msgpack:
+        body = load_msgpack().packb(payload, use_bin_type=True)
+        headers = {
+            "Content-Type": MSGPACK_CONTENT_TYPE,
+            "Accept": MSGPACK_CONTENT_TYPE,
+        }
+    else:
+        body = _json.dumps(payload)
+
+    if compress and len(body) > COMPRESSION_MIN_SIZE:
+        body = gzip.compress(body, compresslevel=1)
+        headers = {**(headers or {}), "Content-Encoding": "gzip"}
+    return body, headers
+
+
+def decode_body(content: bytes, content_type: str) -> Any:
+    """Deserialize a response body according to its Content-Type.
+
+    Args:
+        content (bytes): Response body.
+        content_type (str): Value of the Content-Type header.
+
+    Returns:
+        Any: Decoded body.
+    """
+    if MSGPACK_CONTENT_TYPE in content_type:
+        return load_msgpack().unpackb(content, raw=False)
+    return _json.loads(content)
@@ -0,0 +1,35 @@
+"""
+Client-side rate limiting backed by the optional pyrate-limiter package.
+"""
+
+from typing import Any, Tuple
+
+LIMITER_BUCKET = "deepseek"
+LIMITER_MAX_DELAY = 30
+
+
+def build_limiter(rate_limit: Tuple[int, int]) -> Any:
+    """Create a limiter admitting ``requests`` calls per ``seconds`` window.
+
+    Args:
+        rate_limit (Tuple[int, int]): Pair of (requests, seconds).
+
+    Returns:
+        pyrate_limiter.Limiter: Configured limiter.
+
+    Raises:
+        ImportError: If pyrate-limiter is not installed.
+        ValueError: If either value is not positive.
+    """
+    try:
+        from pyrate_limiter import Duration, Limiter, Rate
+    except ImportError as e:
+        raise ImportError(
+            "rate_limit requires pyrate-limiter. Install it with "
+            "'pip install deepseek-client-python[ratelimit]'."
+        ) from e
+
+    requests, seconds = rate_limit
+    if requests <= 0 or seconds <= 0:
+        raise ValueError("rate_limit values must be positive")
+    return Limiter(Rate(requests, Duration.SECOND * seconds))
@@ -0,0 +1,65 @@
+"""
+Incremental parser for server-sent event (SSE) streams.
+"""
+
+from typing import Any, Dict, List
+
+from . import _json
+
+
+class SSEDecoder:
+    """Split raw SSE bytes into lines and decode ``data:`` payloads as JSON.
+
+    Chunks may end mid-line; the trailing partial line is buffered until the
+    next call to ``feed`` or ``flush``. Once the ``[DONE]`` sentinel is seen,
+    ``done`` is set and further input is ignored.
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+        self.done = False
+
+    def _parse_line(self, line: bytes, events: List[Dict[str, Any]]) -> None:
+        if not line.startswith(b"data:"):
+            return
+        payload = line[5:].strip()
+        if payload == b"[DONE]":
+            self.done = True
+        elif payload:
+            events.append(_json.loads(payload))
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        """Consume a chunk of bytes and return any complete events.
+
+        Args:
+            chunk (bytes): Raw bytes read from the stream.
+
+        Returns:
+            List[Dict[str, Any]]: Parsed event payloads, in order.
+        """
+        events: List[Dict[str, Any]] = []
+        if self.done:
+            return events
+
+        buf = self._buf
+        buf += chunk
+        while not self.done:
+            i = buf.find(b"\n")
+            if i == -1:
+                break
+            line = bytes(buf[:i])
+            del buf[: i + 1]
+            self._parse_line(line, events)
+        return events
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """Parse any buffered partial line at end of stream.
+
+        Returns:
+            List[Dict[str, Any]]: Parsed event payloads, in order.
+        """
+        events: List[Dict[str, Any]] = []
+        if not self.done and self._buf:
+            self._parse_line(bytes(self._buf), events)
+        self._buf.clear()
+        return events
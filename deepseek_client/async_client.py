@@ -0,0 +1,477 @@
+"""
+Asynchronous DeepSeek client built on httpx.
+
+Mirrors the API of ``DeepSeekClient`` so that independent requests can be
+issued concurrently, e.g. ``await asyncio.gather(*[client.chat(m) for m in batch])``.
+"""
+
+import asyncio
+import os
+import time
+import httpx
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple, Union
+
+from . import _json
+from ._models_cache import (
+    is_fresh,
+    models_cache_path,
+    read_models,
+    remote_models_disabled,
+    write_models,
+)
+from ._payload import build_payload, check_range, encode_body
+from ._ratelimit import LIMITER_BUCKET, LIMITER_MAX_DELAY, build_limiter
+from ._sse import SSEDecoder
+from .cache import ResponseCache, SqliteCache, _cache_key
+from .client import default_retry_policy
+
+# Number of times a 429 response carrying Retry-After is retried, matching
+# the retry budget of the synchronous client's adapter.
+MAX_RATE_LIMIT_RETRIES = default_retry_policy().total
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Return the delay requested by a Retry-After header, in seconds."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class AsyncDeepSeekClient:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = "https://api.deepseek.com/v1",
+        default_model: str = "deepseek-chat",
+        default_temperature: float = 0.7,
+        timeout: int = 30,
+        cache: Optional[Union[ResponseCache, SqliteCache]] = None,
+        rate_limit: Optional[Tuple[int, int]] = None,
+        enable_request_compression: bool = False,
+    ):
+        """Initialize the asynchronous DeepSeek API client.
+
+        Args:
+            api_key (Optional[str]): API key. Defaults to DEEPSEEK_API_KEY environment variable.
+            base_url (str): Base API URL. Defaults to "https://api.deepseek.com/v1".
+            default_model (str): Default model for API requests. Defaults to "deepseek-chat".
+            default_temperature (float): Default sampling temperature (0.0-2.0). Defaults to 0.7.
+            timeout (int): Request timeout in seconds. Defaults to 30.
+            cache (Optional[Union[ResponseCache, SqliteCache]]): Cache for non-streaming
+                completions. Defaults to None.
+            rate_limit (Optional[Tuple[int, int]]): Client-side limit as (requests, seconds),
+                e.g. (60, 60) for 60 requests per minute. Requires pyrate-limiter. Defaults to None.
+            enable_request_compression (bool): Gzip request bodies over 1 KiB. Only enable
+                for endpoints that accept Content-Encoding: gzip. Defaults to False.
+        """
+        self.api_key = api_key or os.getenv("DEEPSEEK_API_KEY")
+        if not self.api_key:
+            raise ValueError(
+                "API key required. Set DEEPSEEK_API_KEY environment variable "
+                "or provide explicitly."
+            )
+
+        self.base_url = base_url.rstrip("/")
+        self.default_model = default_model
+        self.default_temperature = default_temperature
+        self.timeout = timeout
+        self.cache = cache
+        self.enable_request_compression = enable_request_compression
+        self._limiter = build_limiter(rate_limit) if rate_limit else None
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": "deepseek-client-python/1.0.0",
+        }
+
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncDeepSeekClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """Handle API response and raise appropriate errors.
+
+        Args:
+            response (httpx.Response): API response object.
+
+        Returns:
+            Dict[str, Any]: JSON response data.
+
+        Raises:
+            httpx.HTTPStatusError: If the API response status code indicates an error.
+            httpx.DecodingError: If a successful response cannot be decoded.
+        """
+        status = response.status_code
+        body = response.content
+        if 200 <= status < 300:
+            if not body:
+                return {}
+            try:
+                return _json.loads(body)
+            except ValueError as e:
+                raise httpx.DecodingError(
+                    f"DeepSeek API returned an undecodable {status} response: {e}",
+                    request=response.request,
+                ) from e
+
+        try:
+            error_data = _json.loads(body)
+            message = error_data.get("message", "Unknown error")
+            code = error_data.get("code", "unknown")
+        except (ValueError, AttributeError):
+            message = body.decode("utf-8", "replace")
+            code = "parse_error"
+
+        raise httpx.HTTPStatusError(
+            f"DeepSeek API Error {status} ({code}): {message}",
+            request=response.request,
+            response=response,
+        )
+
+    async def _acquire(self) -> None:
+        """Wait until the rate limiter admits a request, if one is configured.
+
+        Raises:
+            httpx.HTTPError: If no slot frees up in time.
+        """
+        if self._limiter is None:
+            return
+        if not await self._limiter.try_acquire_async(
+            LIMITER_BUCKET, timeout=LIMITER_MAX_DELAY
+        ):
+            raise httpx.HTTPError(
+                f"Rate limit not acquired within {LIMITER_MAX_DELAY} seconds"
+            )
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a request, honoring Retry-After on 429 responses.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Endpoint path relative to the base URL.
+            payload (Optional[Dict[str, Any]]): JSON request payload.
+            stream (bool): Leave the response body unread for streaming.
+
+        Returns:
+            httpx.Response: Final response.
+        """
+        content, headers = None, None
+        if payload is not None:
+            content, headers = encode_body(payload, self.enable_request_compression)
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await self._acquire()
+            request = self._client.build_request(
+                method, path, content=content, headers=headers
+            )
+            response = await self._client.send(request, stream=stream)
+            if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                return response
+
+            delay = _retry_after(response)
+            if delay is None:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def _post(
+        self, path: str, payload: Dict[str, Any], stream: bool
+    ) -> Any:
+        """Send a POST request, returning the open response when streaming."""
+        if stream:
+            return await self._send("POST", path, payload, stream=True)
+
+        if self.cache is not None:
+            key = _cache_key(f"{self.base_url}{path}", payload)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = await self._send("POST", path, payload)
+        result = self._handle_response(response)
+        if self.cache is not None:
+            self.cache.set(key, result)
+        return result
+
+    async def generate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: int = 1024,
+        top_p: float = 1.0,
+        presence_penalty: float = 0.0,
+        stream: bool = False,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Generate text completion.
+
+        Args:
+            prompt (str): Input text/prompt.
+            model (Optional[str]): Override default model.
+            temperature (Optional[float]): Sampling temperature (0.0-2.0).
+            max_tokens (int): Maximum tokens to generate.
+            top_p (float): Nucleus sampling threshold (0.0-1.0).
+            presence_penalty (float): Repetition penalty (-2.0-2.0).
+            stream (bool): Enable streaming response.
+            **kwargs: Additional keyword arguments to pass to the API.
+
+        Returns:
+            Dict[str, Any]: API response.
+
+        Raises:
+            ValueError: If temperature, top_p or presence_penalty is out of range.
+        """
+        if temperature is None:
+            temperature = self.default_temperature
+        check_range("temperature", temperature)
+        check_range("top_p", top_p)
+        check_range("presence_penalty", presence_penalty)
+
+        payload = build_payload(
+            {
+                "model": self.default_model if model is None else model,
+                "prompt": prompt,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            top_p,
+            presence_penalty,
+            stream,
+            kwargs,
+        )
+
+        return await self._post("/completions", payload, stream)
+
+    async def chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: int = 1024,
+        top_p: float = 1.0,
+        presence_penalty: float = 0.0,
+        stream: bool = False,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Create chat completion.
+
+        Args:
+            messages (List[Dict[str, str]]): List of message dictionaries.
+            model (Optional[str]): Override default model.
+            temperature (Optional[float]): Sampling temperature (0.0-2.0).
+            max_tokens (int): Maximum tokens to generate.
+            top_p (float): Nucleus sampling threshold (0.0-1.0).
+            presence_penalty (float): Repetition penalty (-2.0-2.0).
+            stream (bool): Enable streaming response.
+            **kwargs: Additional keyword arguments to pass to the API.
+
+        Returns:
+            Dict[str, Any]: API response.
+
+        Raises:
+            ValueError: If temperature, top_p or presence_penalty is out of range.
+        """
+        if temperature is None:
+            temperature = self.default_temperature
+        check_range("temperature", temperature)
+        check_range("top_p", top_p)
+        check_range("presence_penalty", presence_penalty)
+
+        payload = build_payload(
+            {
+                "model": self.default_model if model is None else model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            top_p,
+            presence_penalty,
+            stream,
+            kwargs,
+        )
+
+        return await self._post("/chat/completions", payload, stream)
+
+    async def _gather(self, coro_fn, items: List[Any], max_concurrency: int) -> List[Any]:
+        """Await ``coro_fn`` for each item with at most ``max_concurrency`` in flight."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(item):
+            async with semaphore:
+                return await coro_fn(item)
+
+        return await asyncio.gather(*[run(item) for item in items])
+
+    async def generate_batch(
+        self, prompts: List[str], max_concurrency: int = 16, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Generate completions for several prompts concurrently.
+
+        Args:
+            prompts (List[str]): Input texts/prompts.
+            max_concurrency (int): Maximum requests in flight.
+            **kwargs: Keyword arguments passed to ``generate`` for every prompt.
+
+        Returns:
+            List[Dict[str, Any]]: API responses, in the order of ``prompts``.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        return await self._gather(
+            lambda p: self.generate(p, **kwargs), prompts, max_concurrency
+        )
+
+    async def chat_batch(
+        self, messages_list: List[List[Dict[str, str]]], max_concurrency: int = 16, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Create chat completions for several conversations concurrently.
+
+        Args:
+            messages_list (List[List[Dict[str, str]]]): One message list per conversation.
+            max_concurrency (int): Maximum requests in flight.
+            **kwargs: Keyword arguments passed to ``chat`` for every conversation.
+
+        Returns:
+            List[Dict[str, Any]]: API responses, in the order of ``messages_list``.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        return await self._gather(
+            lambda m: self.chat(m, **kwargs), messages_list, max_concurrency
+        )
+
+    async def stream_response(
+        self, response: httpx.Response
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Handle streaming responses.
+
+        Args:
+            response (httpx.Response): Streaming response object.
+
+        Yields:
+            Dict[str, Any]: Parsed ``data:`` payloads, stopping at ``[DONE]``.
+        """
+        decoder = SSEDecoder()
+        try:
+            async for chunk in response.aiter_bytes(8192):
+                for event in decoder.feed(chunk):
+                    yield event
+                if decoder.done:
+                    return
+            for event in decoder.flush():
+                yield event
+        except httpx.TransportError as e:
+            raise httpx.TransportError(f"Stream error: {str(e)}") from e
+        finally:
+            await response.aclose()
+
+    async def iter_raw_chunks(
+        self, response: httpx.Response, chunk_size: int = 8192
+    ) -> AsyncIterator[bytes]:
+        """Yield the raw bytes of a streaming response.
+
+        Intended for proxies that forward the stream unchanged: SSE framing is
+        preserved exactly and no text decoding takes place. Content-Encoding
+        (e.g. gzip) is still removed.
+
+        Args:
+            response (httpx.Response): Streaming response object.
+            chunk_size (int): Maximum number of bytes per chunk.
+
+        Yields:
+            bytes: Response body chunks.
+        """
+        try:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+        except httpx.TransportError as e:
+            raise httpx.TransportError(f"Stream error: {str(e)}") from e
+        finally:
+            await response.aclose()
+
+    async def list_models(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """Retrieve list of available models.
+
+        The catalog is cached on disk for 24 hours and the stale copy is served
+        if the API cannot be reached.
+
+        Args:
+            force_refresh (bool): Bypass a fresh on-disk cache.
+
+        Returns:
+            List[Dict[str, Any]]: List of available models.
+        """
+        path = models_cache_path()
+        if remote_models_disabled():
+            return read_models(path, self.base_url) or []
+        if not force_refresh and is_fresh(path):
+            cached = read_models(path, self.base_url)
+            if cached is not None:
+                return cached
+
+        try:
+            response = await self._send("GET", "/models")
+            models = self._handle_response(response).get("data", [])
+        except httpx.HTTPError:
+            cached = read_models(path, self.base_url)
+            if cached is None:
+                raise
+            return cached
+
+        write_models(path, self.base_url, models)
+        return models
+
+    def set_default_model(self, model: str) -> None:
+        """Update default model for subsequent requests.
+
+        Args:
+            model (str): Model name to set as default.
+        """
+        self.default_model = model
+
+    def set_default_temperature(self, temperature: float) -> None:
+        """Update default temperature (0.0-2.0).
+
+        Args:
+            temperature (float): Temperature value to set as default (0.0-2.0).
+
+        Raises:
+            ValueError: If temperature is not within the valid range [0.0, 2.0].
+        """
+        check_range("temperature", temperature)
+        self.default_temperature = temperature
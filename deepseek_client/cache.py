@@ -0,0 +1,294 @@
+"""
+Response caches for DeepSeek clients.
+
+Caches are keyed on a SHA-256 digest of the endpoint URL and the
+output-affecting fields of a request payload, so identical non-streaming
+requests to the same endpoint can be served locally.
+"""
+
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, Union
+
+from . import _json
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard
+    zstandard = None
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _normalize(value: Any) -> Any:
+    """Recursively NFC-normalize strings and sort dictionary keys."""
+    if isinstance(value, str):
+        return unicodedata.normalize("NFC", value)
+    if isinstance(value, dict):
+        return {k: _normalize(value[k]) for k in sorted(value)}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def _cache_key(url: str, payload: Dict[str, Any]) -> str:
+    """Build a cache key from an endpoint URL and request payload.
+
+    Args:
+        url (str): Full endpoint URL the request is sent to.
+        payload (Dict[str, Any]): Request payload sent to the API.
+
+    Returns:
+        str: Hex-encoded SHA-256 digest of the URL and normalized payload.
+    """
+    fields = {k: v for k, v in payload.items() if k != "stream"}
+    serialized = json.dumps(
+        [url, _normalize(fields)], sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 3600.0):
+        """Initialize an in-memory LRU cache with per-entry expiry.
+
+        Args:
+            max_size (int): Maximum number of cached responses. Defaults to 1024.
+            ttl (Optional[float]): Entry lifetime in seconds, or None to never expire.
+                Defaults to 3600.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for a key, or None on miss.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: Cached response, if present and not expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+        # Copies keep callers' mutations out of the cache, like SqliteCache.
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response, evicting the least recently used entry if full.
+
+        Args:
+            key (str): Cache key.
+            value (Dict[str, Any]): Response to cache.
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters.
+
+        Returns:
+            Dict[str, int]: Hit, miss and eviction counts plus current size.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
+
+
+def _compress(data: bytes) -> bytes:
+    if zstandard is not None:
+        return zstandard.ZstdCompressor().compress(data)
+    return zlib.compress(data)
+
+
+def _decompress(data: bytes) -> bytes:
+    # zstd frames are recognized by their magic number, so databases written
+    # with and without zstandard installed remain readable.
+    if data[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ValueError("zstandard is required to read this cache entry")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class SqliteCache:
+    # Eviction runs once every this many writes rather than on each one.
+    EVICT_EVERY = 64
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        max_size: int = 10000,
+        ttl: Optional[float] = 7 * 24 * 3600.0,
+    ):
+        """Initialize a persistent SQLite-backed response cache.
+
+        Responses are stored compressed with zstandard when installed, zlib otherwise.
+        The default database is shared by every client on the machine; entries stay
+        separate per endpoint because cache keys include the request URL.
+
+        Args:
+            path (Union[str, Path, None]): Database file, or ":memory:".
+                Defaults to ~/.deepseek-client/responses.sqlite3.
+            max_size (int): Maximum number of cached responses. Defaults to 10000.
+            ttl (Optional[float]): Entry lifetime in seconds, or None to never expire.
+                Defaults to 7 days.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        if path is None:
+            path = Path.home() / ".deepseek-client" / "responses.sqlite3"
+        if str(path) != ":memory:":
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries("
+            "key TEXT PRIMARY KEY, model TEXT, response BLOB, tokens INT, "
+            "created_at REAL, last_used REAL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_last_used ON entries(last_used)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for a key, or None on miss.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: Cached response, if present and not expired.
+        """
+        now = time.time()
+        ttl = float("inf") if self.ttl is None else self.ttl
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM entries WHERE key = ? AND (? - created_at) < ?",
+                (key, now, ttl),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET last_used = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self._hits += 1
+        return _json.loads(_decompress(row[0]))
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response, periodically evicting expired and least recently used entries.
+
+        Args:
+            key (str): Cache key.
+            value (Dict[str, Any]): Response to cache.
+        """
+        now = time.time()
+        blob = _compress(_json.dumps(value))
+        usage = value.get("usage") or {}
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, model, response, tokens, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, value.get("model"), blob, usage.get("total_tokens"), now, now),
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """Delete expired entries, then the least recently used beyond max_size."""
+        if self.ttl is not None:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE (? - created_at) >= ?", (now, self.ttl)
+            )
+            self._evictions += cursor.rowcount
+        cursor = self._conn.execute(
+            "DELETE FROM entries WHERE key IN (SELECT key FROM entries "
+            "ORDER BY last_used LIMIT max(0, (SELECT COUNT(*) FROM entries) - ?))",
+            (self.max_size,),
+        )
+        self._evictions += cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters.
+
+        Returns:
+            Dict[str, int]: Hit, miss and eviction counts plus current size.
+        """
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": size,
+            }
@@ -7,10 +7,72 @@ Repository: https://github.com/dsvolk/deepseek-client-python
 
 import os
 import requests
-from typing import Optional, Dict, Any, List, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from requests.utils import default_headers
+from typing import Optional, Dict, Any, List, Iterator, Literal, Tuple, Union
+from urllib3.util.retry import Retry
+
+from . import _json
+from ._models_cache import (
+    is_fresh,
+    models_cache_path,
+    read_capabilities,
+    read_models,
+    remote_models_disabled,
+    write_models,
+)
+from ._payload import (
+    MSGPACK_CONTENT_TYPE,
+    build_payload,
+    check_range,
+    decode_body,
+    encode_body,
+    load_msgpack,
+)
+from ._ratelimit import LIMITER_BUCKET, LIMITER_MAX_DELAY, build_limiter
+from ._sse import SSEDecoder
+from .cache import ResponseCache, SqliteCache, _cache_key
+
+
+def default_retry_policy() -> Retry:
+    """Return the default retry policy used by ``DeepSeekClient``.
+
+    Returns:
+        Retry: Up to 5 retries with exponential backoff on 429 and 5xx responses.
+    """
+    return Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
 
 
 class DeepSeekClient:
+    # Subclasses that add instance attributes must declare their own __slots__.
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "default_model",
+        "default_temperature",
+        "timeout",
+        "headers",
+        "cache",
+        "enable_request_compression",
+        "_session",
+        "_url_completions",
+        "_url_chat",
+        "_url_models",
+        "_limiter",
+        "_pool_size",
+        "wire_format",
+        "_msgpack_supported",
+    )
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -18,6 +80,12 @@ class DeepSeekClient:
         default_model: str = "deepseek-chat",
         default_temperature: float = 0.7,
         timeout: int = 30,
+        cache: Optional[Union[ResponseCache, SqliteCache]] = None,
+        rate_limit: Optional[Tuple[int, int]] = None,
+        pool_size: int = 10,
+        enable_request_compression: bool = False,
+        retry_policy: Optional[Retry] = None,
+        wire_format: Literal["json", "msgpack"] = "json",
     ):
         """Initialize the DeepSeek API client.
 
@@ -27,6 +95,19 @@ class DeepSeekClient:
             default_model (str): Default model for API requests. Defaults to "deepseek-chat".
             default_temperature (float): Default sampling temperature (0.0-2.0). Defaults to 0.7.
             timeout (int): Request timeout in seconds. Defaults to 30.
+            cache (Optional[Union[ResponseCache, SqliteCache]]): Cache for non-streaming
+                completions. Defaults to None.
+            rate_limit (Optional[Tuple[int, int]]): Client-side limit as (requests, seconds),
+                e.g. (60, 60) for 60 requests per minute. Requires pyrate-limiter. Defaults to None.
+            pool_size (int): Maximum pooled connections per host; also caps batch concurrency.
+                Defaults to 10.
+            enable_request_compression (bool): Gzip request bodies over 1 KiB. Only enable
+                for endpoints that accept Content-Encoding: gzip. Defaults to False.
+            retry_policy (Optional[Retry]): urllib3 retry policy for the connection pool.
+                Defaults to 5 retries with exponential backoff on 429/5xx, honoring Retry-After.
+            wire_format (Literal["json", "msgpack"]): Request body encoding. "msgpack" is only
+                used once a probe of the models endpoint shows the server supports it, and
+                requires the msgpack package. Defaults to "json".
         """
         self.api_key = api_key or os.getenv("DEEPSEEK_API_KEY")
         if not self.api_key:
@@ -36,14 +117,58 @@ class DeepSeekClient:
             )
 
         self.base_url = base_url.rstrip("/")
+        self._url_completions = f"{self.base_url}/completions"
+        self._url_chat = f"{self.base_url}/chat/completions"
+        self._url_models = f"{self.base_url}/models"
         self.default_model = default_model
         self.default_temperature = default_temperature
         self.timeout = timeout
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "deepseek-client-python/1.0.0",
-        }
+        self.cache = cache
+        self.enable_request_compression = enable_request_compression
+        self._limiter = build_limiter(rate_limit) if rate_limit else None
+        self._pool_size = pool_size
+
+        if wire_format not in ("json", "msgpack"):
+            raise ValueError("wire_format must be 'json' or 'msgpack'")
+        if wire_format == "msgpack":
+            load_msgpack()
+        self.wire_format = wire_format
+        self._msgpack_supported = None
+        # The session shares this dict, so requests sends it without per-call
+        # header merging. default_headers() keeps Accept/Accept-Encoding.
+        self.headers = default_headers()
+        self.headers.update(
+            {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+                "User-Agent": "deepseek-client-python/1.0.0",
+            }
+        )
+
+        # DNS resolution and the TLS handshake (including CA bundle loading) happen
+        # once per pooled connection, not per request. session.verify is left as
+        # True: requests then uses its CA bundle without per-connection overrides,
+        # whereas an explicit bundle path would be reloaded for each new connection.
+        # urllib3 already sets TCP_NODELAY on every socket.
+        self._session = requests.Session()
+        self._session.headers = self.headers
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry_policy or default_retry_policy(),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "DeepSeekClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle API response and raise appropriate errors.
@@ -56,22 +181,105 @@ class DeepSeekClient:
 
         Raises:
             requests.exceptions.HTTPError: If the API response status code indicates an error.
+            requests.exceptions.InvalidJSONError: If a successful response cannot be decoded.
         """
+        status = response.status_code
+        body = response.content
+        if 200 <= status < 300:
+            if not body:
+                return {}
+            try:
+                return self._decode(response, body)
+            except ValueError as e:
+                raise requests.exceptions.InvalidJSONError(
+                    f"DeepSeek API returned an undecodable {status} response: {e}",
+                    response=response,
+                ) from e
+
         try:
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as err:
+            error_data = self._decode(response, body)
+            message = error_data.get("message", "Unknown error")
+            code = error_data.get("code", "unknown")
+        except (ValueError, AttributeError):
+            message = body.decode("utf-8", "replace")
+            code = "parse_error"
+
+        raise requests.exceptions.HTTPError(
+            f"DeepSeek API Error {status} ({code}): {message}", response=response
+        )
+
+    def _decode(self, response: requests.Response, body: bytes) -> Any:
+        """Decode a response body, honoring msgpack responses when negotiated."""
+        if self.wire_format == "msgpack":
+            return decode_body(body, response.headers.get("Content-Type", ""))
+        return _json.loads(body)
+
+    def _use_msgpack(self) -> bool:
+        """Return True if request bodies should be sent as msgpack.
+
+        The server capability is probed via ``list_models`` and cached with the
+        model catalog. Any probe failure falls back to JSON.
+        """
+        if self.wire_format != "msgpack":
+            return False
+        if self._msgpack_supported is None:
             try:
-                error_data = response.json()
-                message = error_data.get("message", "Unknown error")
-                code = error_data.get("code", "unknown")
-            except ValueError:
-                message = response.text
-                code = "parse_error"
+                self.list_models()
+                if self._msgpack_supported is None:
+                    # Catalog was cached before the capability was probed.
+                    self.list_models(force_refresh=True)
+            except requests.exceptions.RequestException:
+                pass
+            if self._msgpack_supported is None:
+                self._msgpack_supported = False
+        return self._msgpack_supported
 
-            raise requests.exceptions.HTTPError(
-                f"DeepSeek API Error {response.status_code} ({code}): {message}"
-            ) from err
+    def _acquire(self) -> None:
+        """Block until the rate limiter admits a request, if one is configured.
+
+        Raises:
+            requests.exceptions.RequestException: If no slot frees up in time.
+        """
+        if self._limiter is None:
+            return
+        if not self._limiter.try_acquire(LIMITER_BUCKET, timeout=LIMITER_MAX_DELAY):
+            raise requests.exceptions.RequestException(
+                f"Rate limit not acquired within {LIMITER_MAX_DELAY} seconds"
+            )
+
+    def _post(self, url: str, payload: Dict[str, Any], stream: bool) -> Any:
+        """Send a completion request, consulting the response cache if configured.
+
+        Args:
+            url (str): Endpoint URL.
+            payload (Dict[str, Any]): Request payload.
+            stream (bool): Whether to return the raw streaming response.
+
+        Returns:
+            Any: Parsed API response, or the streaming response object.
+        """
+        use_cache = self.cache is not None and not stream
+        if use_cache:
+            key = _cache_key(url, payload)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        use_msgpack = not stream and self._use_msgpack()
+        self._acquire()
+        body, headers = encode_body(
+            payload, self.enable_request_compression, use_msgpack
+        )
+        response = self._session.post(
+            url, data=body, headers=headers, timeout=self.timeout, stream=stream
+        )
+        if stream:
+            return response
+
+        result = self._handle_response(response)
+        if use_cache:
+            self.cache.set(key, result)
+        return result
 
     def generate(
         self,
@@ -98,24 +306,30 @@ class DeepSeekClient:
 
         Returns:
             Dict[str, Any]: API response.
+
+        Raises:
+            ValueError: If temperature, top_p or presence_penalty is out of range.
         """
-        url = f"{self.base_url}/completions"
-        payload = {
-            "model": model or self.default_model,
-            "prompt": prompt,
-            "temperature": temperature or self.default_temperature,
-            "max_tokens": max_tokens,
-            "top_p": top_p,
-            "presence_penalty": presence_penalty,
-            "stream": stream,
-            **kwargs,
-        }
-
-        response = requests.post(
-            url, headers=self.headers, json=payload, timeout=self.timeout, stream=stream
+        if temperature is None:
+            temperature = self.default_temperature
+        check_range("temperature", temperature)
+        check_range("top_p", top_p)
+        check_range("presence_penalty", presence_penalty)
+
+        payload = build_payload(
+            {
+                "model": self.default_model if model is None else model,
+                "prompt": prompt,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            top_p,
+            presence_penalty,
+            stream,
+            kwargs,
         )
 
-        return self._handle_response(response) if not stream else response
+        return self._post(self._url_completions, payload, stream)
 
     def chat(
         self,
@@ -142,50 +356,175 @@ class DeepSeekClient:
 
         Returns:
             Dict[str, Any]: API response.
+
+        Raises:
+            ValueError: If temperature, top_p or presence_penalty is out of range.
         """
-        url = f"{self.base_url}/chat/completions"
-        payload = {
-            "model": model or self.default_model,
-            "messages": messages,
-            "temperature": temperature or self.default_temperature,
-            "max_tokens": max_tokens,
-            "top_p": top_p,
-            "presence_penalty": presence_penalty,
-            "stream": stream,
-            **kwargs,
-        }
-
-        response = requests.post(
-            url, headers=self.headers, json=payload, timeout=self.timeout, stream=stream
+        if temperature is None:
+            temperature = self.default_temperature
+        check_range("temperature", temperature)
+        check_range("top_p", top_p)
+        check_range("presence_penalty", presence_penalty)
+
+        payload = build_payload(
+            {
+                "model": self.default_model if model is None else model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            top_p,
+            presence_penalty,
+            stream,
+            kwargs,
         )
 
-        return self._handle_response(response) if not stream else response
+        return self._post(self._url_chat, payload, stream)
+
+    def _map(self, fn, items: List[Any], max_concurrency: int) -> List[Any]:
+        """Apply ``fn`` to each item concurrently over the shared session."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        workers = min(max_concurrency, self._pool_size, len(items))
+        if workers <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fn, items))
+
+    def generate_batch(
+        self, prompts: List[str], max_concurrency: int = 8, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Generate completions for several prompts concurrently.
+
+        Args:
+            prompts (List[str]): Input texts/prompts.
+            max_concurrency (int): Maximum requests in flight, capped at the pool size.
+            **kwargs: Keyword arguments passed to ``generate`` for every prompt.
+
+        Returns:
+            List[Dict[str, Any]]: API responses, in the order of ``prompts``.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        return self._map(lambda p: self.generate(p, **kwargs), prompts, max_concurrency)
+
+    def chat_batch(
+        self, messages_list: List[List[Dict[str, str]]], max_concurrency: int = 8, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Create chat completions for several conversations concurrently.
+
+        Args:
+            messages_list (List[List[Dict[str, str]]]): One message list per conversation.
+            max_concurrency (int): Maximum requests in flight, capped at the pool size.
+            **kwargs: Keyword arguments passed to ``chat`` for every conversation.
+
+        Returns:
+            List[Dict[str, Any]]: API responses, in the order of ``messages_list``.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        return self._map(
+            lambda m: self.chat(m, **kwargs), messages_list, max_concurrency
+        )
 
-    def stream_response(self, response: requests.Response) -> Iterator[str]:
+    def stream_response(self, response: requests.Response) -> Iterator[Dict[str, Any]]:
         """Handle streaming responses.
 
         Args:
             response (requests.Response): Streaming response object.
 
         Yields:
-            str: Incremental response chunks.
+            Dict[str, Any]: Parsed ``data:`` payloads, stopping at ``[DONE]``.
         """
+        decoder = SSEDecoder()
         try:
-            for line in response.iter_lines():
-                if line:
-                    yield line.decode("utf-8")
+            for chunk in response.iter_content(chunk_size=8192):
+                yield from decoder.feed(chunk)
+                if decoder.done:
+                    return
+            yield from decoder.flush()
         except requests.exceptions.ChunkedEncodingError as e:
             raise requests.exceptions.RequestException(f"Stream error: {str(e)}") from e
 
-    def list_models(self) -> List[Dict[str, Any]]:
+    def iter_raw_chunks(
+        self, response: requests.Response, chunk_size: int = 8192
+    ) -> Iterator[bytes]:
+        """Yield the raw bytes of a streaming response.
+
+        Intended for proxies that forward the stream unchanged: SSE framing is
+        preserved exactly and no text decoding takes place. Content-Encoding
+        (e.g. gzip) is still removed.
+
+        Args:
+            response (requests.Response): Streaming response object.
+            chunk_size (int): Maximum number of bytes per chunk.
+
+        Yields:
+            bytes: Response body chunks.
+        """
+        try:
+            yield from response.iter_content(chunk_size=chunk_size)
+        except requests.exceptions.ChunkedEncodingError as e:
+            raise requests.exceptions.RequestException(f"Stream error: {str(e)}") from e
+
+    def list_models(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
         """Retrieve list of available models.
 
+        The catalog is cached on disk for 24 hours and the stale copy is served
+        if the API cannot be reached.
+
+        Args:
+            force_refresh (bool): Bypass a fresh on-disk cache.
+
         Returns:
             List[Dict[str, Any]]: List of available models.
         """
-        url = f"{self.base_url}/models"
-        response = requests.get(url, headers=self.headers, timeout=self.timeout)
-        return self._handle_response(response).get("data", [])
+        path = models_cache_path()
+        if remote_models_disabled():
+            self._load_capabilities(path)
+            return read_models(path, self.base_url) or []
+        if not force_refresh and is_fresh(path):
+            cached = read_models(path, self.base_url)
+            if cached is not None:
+                self._load_capabilities(path)
+                return cached
+
+        capabilities = None
+        try:
+            self._acquire()
+            if self.wire_format == "msgpack":
+                response = self._session.get(
+                    self._url_models,
+                    headers={"Accept": f"{MSGPACK_CONTENT_TYPE}, application/json;q=0.9"},
+                    timeout=self.timeout,
+                )
+            else:
+                response = self._session.get(self._url_models, timeout=self.timeout)
+            models = self._handle_response(response).get("data", [])
+        except requests.exceptions.RequestException:
+            cached = read_models(path, self.base_url)
+            if cached is None:
+                raise
+            self._load_capabilities(path)
+            return cached
+
+        if self.wire_format == "msgpack":
+            self._msgpack_supported = MSGPACK_CONTENT_TYPE in response.headers.get(
+                "Content-Type", ""
+            )
+            capabilities = {"msgpack": self._msgpack_supported}
+        write_models(path, self.base_url, models, capabilities)
+        return models
+
+    def _load_capabilities(self, path: Path) -> None:
+        """Restore probed server capabilities from the model catalog cache."""
+        if self.wire_format != "msgpack":
+            return
+        capabilities = read_capabilities(path, self.base_url)
+        if capabilities is not None and "msgpack" in capabilities:
+            self._msgpack_supported = capabilities["msgpack"]
 
     def set_default_model(self, model: str) -> None:
         """Update default model for subsequent requests.
@@ -204,6 +543,5 @@ class DeepSeekClient:
         Raises:
             ValueError: If temperature is not within the valid range [0.0, 2.0].
         """
-        if not 0.0 <= temperature <= 2.0:
-            raise ValueError("Temperature must be between 0.0 and 2.0")
+        check_range("temperature", temperature)
         self.default_temperature = temperature
@@ -2,6 +2,14 @@ import pytest
 from deepseek_client.client import DeepSeekClient
 
 
+@pytest.fixture(autouse=True)
+def models_cache_path(tmp_path, monkeypatch):
+    path = tmp_path / "models.json"
+    monkeypatch.setenv("DEEPSEEK_MODELS_PATH", str(path))
+    monkeypatch.delenv("DEEPSEEK_DISABLE_REMOTE_MODELS", raising=False)
+    return path
+
+
 @pytest.fixture
 def mock_client():
     return DeepSeekClient(api_key="test_key", base_url="https://mock.api.deepseek.com")
@@ -0,0 +1,225 @@
+import asyncio
+import json
+import httpx
+import pytest
+from deepseek_client.async_client import AsyncDeepSeekClient
+
+
+def make_client(handler):
+    client = AsyncDeepSeekClient(
+        api_key="test_key", base_url="https://mock.api.deepseek.com/v1"
+    )
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url,
+        headers=client.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+def test_async_chat_success():
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": "Test response"}}]}
+        )
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.chat(messages=[{"role": "user", "content": "Test"}])
+
+    response = asyncio.run(run())
+    assert response["choices"][0]["message"]["content"] == "Test response"
+    assert str(requests_seen[0].url) == "https://mock.api.deepseek.com/v1/chat/completions"
+    assert requests_seen[0].headers["Authorization"] == "Bearer test_key"
+    assert json.loads(requests_seen[0].content)["model"] == "deepseek-chat"
+
+
+def test_async_generate_sends_zero_temperature():
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={})
+
+    async def run():
+        async with make_client(handler) as client:
+            await client.generate(prompt="x", temperature=0.0)
+
+    asyncio.run(run())
+    assert bodies[0]["temperature"] == 0.0
+
+
+def test_async_concurrent_generate():
+    def handler(request):
+        prompt = json.loads(request.content)["prompt"]
+        return httpx.Response(200, json={"choices": [{"text": prompt.upper()}]})
+
+    async def run():
+        async with make_client(handler) as client:
+            return await asyncio.gather(
+                *[client.generate(prompt=p) for p in ("a", "b", "c")]
+            )
+
+    responses = asyncio.run(run())
+    assert [r["choices"][0]["text"] for r in responses] == ["A", "B", "C"]
+
+
+def test_async_chat_batch_bounds_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        content = json.loads(request.content)["messages"][0]["content"]
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.chat_batch(
+                [[{"role": "user", "content": str(i)}] for i in range(10)],
+                max_concurrency=3,
+            )
+
+    responses = asyncio.run(run())
+    assert [r["choices"][0]["message"]["content"] for r in responses] == [
+        str(i) for i in range(10)
+    ]
+    assert peak <= 3
+
+
+def test_async_batch_rejects_non_positive_concurrency():
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, json={})
+
+    async def run(max_concurrency):
+        async with make_client(handler) as client:
+            await client.generate_batch(["a"], max_concurrency=max_concurrency)
+
+    for max_concurrency in (0, -1):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            asyncio.run(asyncio.wait_for(run(max_concurrency), timeout=1))
+    assert requests_seen == []
+
+
+def test_async_chat_streaming():
+    def handler(request):
+        return httpx.Response(
+            200,
+            content=(
+                b'data: {"choices": [{"delta": {"content": "Chunk1"}}]}\n\n'
+                b'data: {"choices": [{"delta": {"content": "Chunk2"}}]}\n\n'
+                b"data: [DONE]\n\n"
+            ),
+        )
+
+    async def run():
+        async with make_client(handler) as client:
+            response = await client.chat(
+                messages=[{"role": "user", "content": "Test"}], stream=True
+            )
+            return [chunk async for chunk in client.stream_response(response)]
+
+    assert asyncio.run(run()) == [
+        {"choices": [{"delta": {"content": "Chunk1"}}]},
+        {"choices": [{"delta": {"content": "Chunk2"}}]},
+    ]
+
+
+class FailingStream(httpx.AsyncByteStream):
+    async def __aiter__(self):
+        yield b'data: {"choices": [{"delta": {"content": "Chunk1"}}]}\n\n'
+        raise httpx.RemoteProtocolError("peer closed connection")
+
+
+def test_async_stream_transport_error_is_wrapped():
+    async def run():
+        async with make_client(
+            lambda request: httpx.Response(200, stream=FailingStream())
+        ) as client:
+            response = await client.chat(
+                messages=[{"role": "user", "content": "Test"}], stream=True
+            )
+            return [chunk async for chunk in client.stream_response(response)]
+
+    with pytest.raises(httpx.TransportError, match="Stream error: peer closed"):
+        asyncio.run(run())
+
+
+def test_async_iter_raw_chunks():
+    body = b'data: {"choices": []}\n\ndata: [DONE]\n\n'
+
+    async def run():
+        async with make_client(lambda request: httpx.Response(200, content=body)) as client:
+            response = await client.chat(
+                messages=[{"role": "user", "content": "Test"}], stream=True
+            )
+            return b"".join([chunk async for chunk in client.iter_raw_chunks(response)])
+
+    assert asyncio.run(run()) == body
+
+
+def test_async_iter_raw_chunks_transport_error_is_wrapped():
+    async def run():
+        async with make_client(
+            lambda request: httpx.Response(200, stream=FailingStream())
+        ) as client:
+            response = await client.chat(
+                messages=[{"role": "user", "content": "Test"}], stream=True
+            )
+            return [chunk async for chunk in client.iter_raw_chunks(response)]
+
+    with pytest.raises(httpx.TransportError, match="Stream error: peer closed"):
+        asyncio.run(run())
+
+
+def test_async_api_error_handling():
+    def handler(request):
+        return httpx.Response(
+            400,
+            json={"message": "Invalid request parameters", "code": "invalid_request"},
+        )
+
+    async def run():
+        async with make_client(handler) as client:
+            await client.generate(prompt="Test")
+
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        asyncio.run(run())
+    assert "400" in str(excinfo.value)
+    assert "invalid_request" in str(excinfo.value)
+
+
+def test_async_non_json_success_body_raises_http_error():
+    async def run():
+        async with make_client(
+            lambda request: httpx.Response(200, content=b"<html>Captive portal</html>")
+        ) as client:
+            await client.generate(prompt="Test")
+
+    with pytest.raises(httpx.DecodingError):
+        asyncio.run(run())
+
+
+def test_async_retries_429_with_retry_after():
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"data": [{"id": "model1"}]}),
+        ]
+    )
+
+    async def run():
+        async with make_client(lambda request: next(responses)) as client:
+            return await client.list_models()
+
+    assert asyncio.run(run()) == [{"id": "model1"}]
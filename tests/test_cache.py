@@ -0,0 +1,110 @@
+from unittest.mock import patch
+from deepseek_client.cache import ResponseCache, SqliteCache, _cache_key
+
+URL = "https://api.deepseek.com/chat/completions"
+
+
+def test_cache_key_ignores_stream_and_key_order():
+    a = {"model": "deepseek-chat", "prompt": "x", "temperature": 0.7, "stream": False}
+    b = {"stream": True, "temperature": 0.7, "prompt": "x", "model": "deepseek-chat"}
+    assert _cache_key(URL, a) == _cache_key(URL, b)
+
+
+def test_cache_key_normalizes_unicode():
+    composed = {"messages": [{"role": "user", "content": "caf\u00e9"}]}
+    decomposed = {"messages": [{"content": "cafe\u0301", "role": "user"}]}
+    assert _cache_key(URL, composed) == _cache_key(URL, decomposed)
+
+
+def test_cache_key_differs_on_output_fields():
+    assert _cache_key(URL, {"prompt": "x", "temperature": 0.0}) != _cache_key(
+        URL, {"prompt": "x", "temperature": 0.7}
+    )
+
+
+def test_cache_key_differs_on_url():
+    payload = {"model": "deepseek-chat", "prompt": "x"}
+    assert _cache_key(URL, payload) != _cache_key(
+        "https://proxy.example.com/chat/completions", payload
+    )
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_size=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 1, "size": 2}
+
+
+def test_cached_responses_are_copies():
+    cache = ResponseCache()
+    response = {"choices": [{"text": "a"}]}
+    cache.set("a", response)
+    response["choices"].append({"text": "b"})
+
+    hit = cache.get("a")
+    hit["choices"].append({"text": "c"})
+    assert cache.get("a") == {"choices": [{"text": "a"}]}
+
+
+@patch("deepseek_client.cache.time.monotonic")
+def test_ttl_expiry(mock_monotonic):
+    mock_monotonic.return_value = 100.0
+    cache = ResponseCache(ttl=10)
+    cache.set("a", {"v": 1})
+
+    mock_monotonic.return_value = 109.0
+    assert cache.get("a") == {"v": 1}
+    mock_monotonic.return_value = 110.0
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "responses.sqlite3"
+    response = {"model": "deepseek-chat", "usage": {"total_tokens": 7}}
+
+    cache = SqliteCache(path)
+    cache.set("a", response)
+    cache.close()
+
+    cache = SqliteCache(path)
+    assert cache.get("a") == response
+    assert cache.get("b") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+
+@patch("deepseek_client.cache.time.time")
+def test_sqlite_cache_ttl_expiry(mock_time):
+    mock_time.return_value = 100.0
+    cache = SqliteCache(":memory:", ttl=10)
+    cache.set("a", {"v": 1})
+
+    mock_time.return_value = 109.0
+    assert cache.get("a") == {"v": 1}
+    mock_time.return_value = 110.0
+    assert cache.get("a") is None
+
+
+@patch("deepseek_client.cache.time.time")
+def test_sqlite_cache_evicts_least_recently_used(mock_time):
+    cache = SqliteCache(":memory:", max_size=2)
+    cache.EVICT_EVERY = 1
+    for i, key in enumerate(("a", "b")):
+        mock_time.return_value = float(i)
+        cache.set(key, {"v": key})
+
+    mock_time.return_value = 2.0
+    cache.get("a")
+    mock_time.return_value = 3.0
+    cache.set("c", {"v": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": "a"}
+    assert cache.get("c") == {"v": "c"}
+    assert cache.stats()["evictions"] == 1
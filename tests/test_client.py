@@ -1,6 +1,10 @@
+import gzip
+import json
 import pytest
 import requests
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
+from urllib3.util.retry import Retry
+from deepseek_client.cache import ResponseCache, SqliteCache
 from deepseek_client.client import DeepSeekClient
 
 
@@ -12,48 +16,84 @@ def test_client_initialization():
     assert client.headers["Authorization"] == "Bearer test_key"
 
 
+def test_client_has_no_instance_dict(mock_client):
+    assert not hasattr(mock_client, "__dict__")
+    with pytest.raises(AttributeError):
+        mock_client.unexpected = True
+
+
 def test_missing_api_key():
     with pytest.raises(ValueError) as excinfo:
         DeepSeekClient(api_key=None)
     assert "API key required" in str(excinfo.value)
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_generate_success(mock_post, mock_client):
     mock_response = Mock()
-    mock_response.json.return_value = {
-        "choices": [{"text": "Test response"}],
-        "usage": {"total_tokens": 10},
-    }
-    mock_response.raise_for_status.return_value = None
+    mock_response.status_code = 200
+    mock_response.content = json.dumps(
+        {
+            "choices": [{"text": "Test response"}],
+            "usage": {"total_tokens": 10},
+        }
+    ).encode()
     mock_post.return_value = mock_response
 
     response = mock_client.generate(prompt="Test prompt")
     assert response["choices"][0]["text"] == "Test response"
     mock_post.assert_called_once_with(
         "https://mock.api.deepseek.com/completions",
-        headers=mock_client.headers,
-        json={
-            "model": "deepseek-chat",
-            "prompt": "Test prompt",
-            "temperature": 0.7,
-            "max_tokens": 1024,
-            "top_p": 1.0,
-            "presence_penalty": 0.0,
-            "stream": False,
-        },
+        data=ANY,
+        headers=None,
         timeout=30,
         stream=False,
     )
+    assert json.loads(mock_post.call_args.kwargs["data"]) == {
+        "model": "deepseek-chat",
+        "prompt": "Test prompt",
+        "temperature": 0.7,
+        "max_tokens": 1024,
+    }
+
+
+@patch("requests.Session.post")
+def test_generate_sends_zero_temperature(mock_post, mock_client):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b"{}"
+    mock_post.return_value = mock_response
 
+    mock_client.generate(prompt="x", temperature=0.0)
+    assert json.loads(mock_post.call_args.kwargs["data"])["temperature"] == 0.0
 
-@patch("requests.post")
+
+@patch("requests.Session.post")
+def test_zero_temperature_does_not_share_cache_entry_with_default(mock_post):
+    client = DeepSeekClient(api_key="test_key", cache=ResponseCache())
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b"{}"
+    mock_post.return_value = mock_response
+
+    client.chat(messages=[{"role": "user", "content": "x"}], temperature=0.0)
+    client.chat(messages=[{"role": "user", "content": "x"}])
+    client.chat(messages=[{"role": "user", "content": "x"}], temperature=0.0)
+
+    assert mock_post.call_count == 2
+    assert client.cache.stats()["hits"] == 1
+
+
+@patch("requests.Session.post")
 def test_chat_streaming(mock_post, mock_client):
     mock_response = Mock()
-    # Simulate SSE format with "data: " prefix
-    mock_response.iter_lines.return_value = [
-        b'data: {"choices": [{"delta": {"content": "Chunk1"}}]}',
-        b'data: {"choices": [{"delta": {"content": "Chunk2"}}]}',
+    mock_response.status_code = 200
+    # SSE frames split across chunk boundaries
+    mock_response.iter_content.return_value = [
+        b'data: {"choices": [{"delta": {"content": "Chunk1"}}]}\n\ndata: {"cho',
+        b'ices": [{"delta": {"content": "Chunk2"}}]}\r\n\n',
+        b"data: [DONE]\n\n",
+        b'data: {"choices": [{"delta": {"content": "ignored"}}]}\n\n',
     ]
     mock_post.return_value = mock_response
 
@@ -62,11 +102,227 @@ def test_chat_streaming(mock_post, mock_client):
     )
     chunks = list(mock_client.stream_response(stream))
 
-    # Include "data: " prefix in expected values
     assert chunks == [
-        'data: {"choices": [{"delta": {"content": "Chunk1"}}]}',
-        'data: {"choices": [{"delta": {"content": "Chunk2"}}]}',
+        {"choices": [{"delta": {"content": "Chunk1"}}]},
+        {"choices": [{"delta": {"content": "Chunk2"}}]},
     ]
+    mock_response.iter_content.assert_called_once_with(chunk_size=8192)
+
+
+@patch("requests.Session.post")
+def test_chat_sends_non_default_parameters(mock_post, mock_client):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b"{}"
+    mock_post.return_value = mock_response
+
+    mock_client.chat(
+        messages=[{"role": "user", "content": "Test"}],
+        top_p=0.9,
+        presence_penalty=0.0,
+        stop=["\n"],
+    )
+    assert json.loads(mock_post.call_args.kwargs["data"]) == {
+        "model": "deepseek-chat",
+        "messages": [{"role": "user", "content": "Test"}],
+        "temperature": 0.7,
+        "max_tokens": 1024,
+        "top_p": 0.9,
+        "stop": ["\n"],
+    }
+
+
+@patch("requests.Session.post")
+def test_generate_batch_preserves_order(mock_post, mock_client):
+    def respond(url, data, headers, timeout, stream):
+        response = Mock()
+        response.status_code = 200
+        prompt = json.loads(data)["prompt"]
+        response.content = json.dumps({"choices": [{"text": prompt}]}).encode()
+        return response
+
+    mock_post.side_effect = respond
+
+    prompts = [f"prompt {i}" for i in range(20)]
+    responses = mock_client.generate_batch(prompts, max_concurrency=4, max_tokens=5)
+
+    assert [r["choices"][0]["text"] for r in responses] == prompts
+    assert mock_post.call_count == 20
+    assert json.loads(mock_post.call_args.kwargs["data"])["max_tokens"] == 5
+
+
+@patch("requests.Session.post")
+def test_batch_rejects_non_positive_concurrency(mock_post, mock_client):
+    for max_concurrency in (0, -1):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            mock_client.generate_batch(["a"], max_concurrency=max_concurrency)
+        with pytest.raises(ValueError, match="max_concurrency"):
+            mock_client.chat_batch(
+                [[{"role": "user", "content": "a"}]], max_concurrency=max_concurrency
+            )
+    mock_post.assert_not_called()
+
+
+@patch("requests.Session.post")
+def test_large_request_bodies_are_gzipped(mock_post):
+    client = DeepSeekClient(api_key="test_key", enable_request_compression=True)
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b"{}"
+    mock_post.return_value = mock_response
+
+    client.chat(messages=[{"role": "user", "content": "x"}])
+    assert mock_post.call_args.kwargs["headers"] is None
+
+    messages = [{"role": "user", "content": "x" * 2000}]
+    client.chat(messages=messages)
+    kwargs = mock_post.call_args.kwargs
+    assert kwargs["headers"] == {"Content-Encoding": "gzip"}
+    assert json.loads(gzip.decompress(kwargs["data"]))["messages"] == messages
+
+
+def test_retry_policy(mock_client):
+    retries = mock_client._session.get_adapter("https://").max_retries
+    assert retries.total == 5
+    assert 429 in retries.status_forcelist
+    assert retries.respect_retry_after_header
+    assert not retries.raise_on_status
+
+    client = DeepSeekClient(api_key="test_key", retry_policy=Retry(total=1))
+    assert client._session.get_adapter("https://").max_retries.total == 1
+
+
+@patch("requests.Session.post")
+def test_iter_raw_chunks_passes_bytes_through(mock_post, mock_client):
+    chunks = [b'data: {"choices": []}\n', b"\ndata: [DONE]\n\n"]
+    mock_response = Mock()
+    mock_response.iter_content.return_value = iter(chunks)
+    mock_post.return_value = mock_response
+
+    stream = mock_client.chat(
+        messages=[{"role": "user", "content": "Test"}], stream=True
+    )
+    assert list(mock_client.iter_raw_chunks(stream, chunk_size=4096)) == chunks
+    mock_response.iter_content.assert_called_once_with(chunk_size=4096)
+
+
+def test_requests_share_one_pooled_adapter(mock_client):
+    adapter = mock_client._session.get_adapter("https://mock.api.deepseek.com")
+    assert mock_client._session.get_adapter("http://mock.api.deepseek.com") is adapter
+    assert mock_client._session.verify is True
+
+
+@patch("requests.Session.post")
+def test_chat_sends_int_keyed_kwargs(mock_post, mock_client):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b"{}"
+    mock_post.return_value = mock_response
+
+    mock_client.chat(
+        messages=[{"role": "user", "content": "Test"}], logit_bias={50256: -100}
+    )
+    body = json.loads(mock_post.call_args.kwargs["data"])
+    assert body["logit_bias"] == {"50256": -100}
+
+
+def test_session_reuses_headers(mock_client):
+    assert mock_client._session.headers is mock_client.headers
+    assert mock_client.headers["authorization"] == "Bearer test_key"
+    assert mock_client._session.headers["Authorization"] == "Bearer test_key"
+    assert mock_client._session.headers["Content-Type"] == "application/json"
+
+
+@patch("requests.Session.close")
+def test_context_manager_closes_session(mock_close):
+    with DeepSeekClient(api_key="test_key"):
+        pass
+    mock_close.assert_called_once()
+
+
+@patch("requests.Session.post")
+def test_generate_uses_cache(mock_post):
+    client = DeepSeekClient(api_key="test_key", cache=ResponseCache())
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({"choices": [{"text": "Cached"}]}).encode()
+    mock_post.return_value = mock_response
+
+    first = client.generate(prompt="Test prompt")
+    second = client.generate(prompt="Test prompt")
+
+    assert first == second == {"choices": [{"text": "Cached"}]}
+    mock_post.assert_called_once()
+    assert client.cache.stats()["hits"] == 1
+
+
+@patch("requests.Session.post")
+def test_cache_is_not_shared_across_base_urls(mock_post):
+    cache = ResponseCache()
+    first = DeepSeekClient(api_key="test_key", cache=cache)
+    second = DeepSeekClient(
+        api_key="test_key", base_url="https://proxy.example.com", cache=cache
+    )
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({"choices": [{"text": "Hi"}]}).encode()
+    mock_post.return_value = mock_response
+
+    first.generate(prompt="Test prompt")
+    second.generate(prompt="Test prompt")
+
+    assert mock_post.call_count == 2
+    assert cache.stats()["hits"] == 0
+
+
+@patch("requests.Session.post")
+def test_default_sqlite_cache_is_not_shared_across_base_urls(
+    mock_post, tmp_path, monkeypatch
+):
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    first = DeepSeekClient(api_key="test_key", cache=SqliteCache())
+    second = DeepSeekClient(
+        api_key="test_key", base_url="https://proxy.example.com", cache=SqliteCache()
+    )
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({"choices": [{"text": "Hi"}]}).encode()
+    mock_post.return_value = mock_response
+
+    first.generate(prompt="Test prompt")
+    second.generate(prompt="Test prompt")
+    first.generate(prompt="Test prompt")
+
+    assert mock_post.call_count == 2
+    assert (tmp_path / ".deepseek-client" / "responses.sqlite3").exists()
+    first.cache.close()
+    second.cache.close()
+
+
+@patch("requests.Session.get")
+def test_rate_limit_acquires_before_request(mock_get):
+    pytest.importorskip("pyrate_limiter")
+    client = DeepSeekClient(api_key="test_key", rate_limit=(2, 60))
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({"data": []}).encode()
+    mock_get.return_value = mock_response
+
+    client.list_models()
+    client.list_models(force_refresh=True)
+    assert not client._limiter.try_acquire("deepseek", blocking=False)
+    assert mock_get.call_count == 2
+
+
+@patch("requests.Session.post")
+def test_out_of_range_parameters_fail_before_request(mock_post, mock_client):
+    with pytest.raises(ValueError, match="Temperature must be between 0.0 and 2.0"):
+        mock_client.generate(prompt="x", temperature=2.5)
+    with pytest.raises(ValueError, match="Top p must be between 0.0 and 1.0"):
+        mock_client.chat(messages=[{"role": "user", "content": "x"}], top_p=1.5)
+    with pytest.raises(ValueError, match="Presence penalty must be between -2.0 and 2.0"):
+        mock_client.generate(prompt="x", presence_penalty=-3.0)
+    mock_post.assert_not_called()
 
 
 def test_parameter_validation(mock_client):
@@ -81,7 +337,7 @@ from unittest.mock import Mock, patch
 from deepseek_client.client import DeepSeekClient
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_api_error_handling(mock_post):
     # Setup mock client
     client = DeepSeekClient(
@@ -91,13 +347,12 @@ def test_api_error_handling(mock_post):
     # Configure mock response
     mock_response = Mock()
     mock_response.status_code = 400
-    mock_response.json.return_value = {
-        "message": "Invalid request parameters",
-        "code": "invalid_request",
-    }
-    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
-        "400 Client Error", response=mock_response
-    )
+    mock_response.content = json.dumps(
+        {
+            "message": "Invalid request parameters",
+            "code": "invalid_request",
+        }
+    ).encode()
     mock_post.return_value = mock_response
 
     # Test error handling
@@ -108,16 +363,164 @@ def test_api_error_handling(mock_post):
     assert "400" in str(excinfo.value)
     assert "Invalid request parameters" in str(excinfo.value)
     assert "invalid_request" in str(excinfo.value)
+    assert excinfo.value.response is mock_response
+
+
+@patch("requests.Session.post")
+def test_api_error_with_non_json_body(mock_post, mock_client):
+    mock_response = Mock()
+    mock_response.status_code = 502
+    mock_response.content = b"<html>Bad Gateway</html>"
+    mock_post.return_value = mock_response
+
+    with pytest.raises(requests.exceptions.HTTPError) as excinfo:
+        mock_client.generate(prompt="Test")
+
+    assert "502" in str(excinfo.value)
+    assert "parse_error" in str(excinfo.value)
+    assert "Bad Gateway" in str(excinfo.value)
 
 
-@patch("requests.get")
+@patch("requests.Session.post")
+def test_non_json_success_body_raises_request_exception(mock_post, mock_client):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b"<html>Captive portal</html>"
+    mock_post.return_value = mock_response
+
+    with pytest.raises(requests.exceptions.InvalidJSONError) as excinfo:
+        mock_client.generate(prompt="Test")
+
+    assert isinstance(excinfo.value, requests.exceptions.RequestException)
+    assert excinfo.value.response is mock_response
+
+
+@patch("requests.Session.get")
 def test_list_models(mock_get, mock_client):
     mock_response = Mock()
-    mock_response.json.return_value = {"data": [{"id": "model1"}, {"id": "model2"}]}
+    mock_response.status_code = 200
+    mock_response.content = json.dumps(
+        {"data": [{"id": "model1"}, {"id": "model2"}]}
+    ).encode()
     mock_get.return_value = mock_response
 
     models = mock_client.list_models()
     assert len(models) == 2
     mock_get.assert_called_once_with(
-        "https://mock.api.deepseek.com/models", headers=mock_client.headers, timeout=30
+        "https://mock.api.deepseek.com/models", timeout=30
+    )
+
+
+@patch("requests.Session.get")
+def test_list_models_served_from_disk_cache(mock_get, mock_client, models_cache_path):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({"data": [{"id": "model1"}]}).encode()
+    mock_get.return_value = mock_response
+
+    assert mock_client.list_models() == [{"id": "model1"}]
+    assert mock_client.list_models() == [{"id": "model1"}]
+    assert models_cache_path.exists()
+    mock_get.assert_called_once()
+
+    mock_client.list_models(force_refresh=True)
+    assert mock_get.call_count == 2
+
+
+@patch("requests.Session.get")
+def test_list_models_falls_back_to_stale_cache(mock_get, mock_client, models_cache_path):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({"data": [{"id": "model1"}]}).encode()
+    mock_get.return_value = mock_response
+    mock_client.list_models()
+
+    mock_get.side_effect = requests.exceptions.ConnectionError("offline")
+    assert mock_client.list_models(force_refresh=True) == [{"id": "model1"}]
+
+    models_cache_path.unlink()
+    with pytest.raises(requests.exceptions.ConnectionError):
+        mock_client.list_models(force_refresh=True)
+
+
+@patch("requests.Session.get")
+def test_list_models_falls_back_on_non_json_success(mock_get, mock_client, models_cache_path):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({"data": [{"id": "model1"}]}).encode()
+    mock_get.return_value = mock_response
+    mock_client.list_models()
+
+    portal = Mock()
+    portal.status_code = 200
+    portal.content = b"<html>Captive portal</html>"
+    portal.headers = {"Content-Type": "text/html"}
+    mock_get.return_value = portal
+    assert mock_client.list_models(force_refresh=True) == [{"id": "model1"}]
+
+    models_cache_path.unlink()
+    with pytest.raises(requests.exceptions.RequestException):
+        mock_client.list_models(force_refresh=True)
+
+
+@patch("requests.Session.get")
+def test_list_models_remote_disabled(mock_get, mock_client, monkeypatch):
+    monkeypatch.setenv("DEEPSEEK_DISABLE_REMOTE_MODELS", "1")
+    assert mock_client.list_models() == []
+    mock_get.assert_not_called()
+
+
+def _probe_response(content_type, body):
+    response = Mock()
+    response.status_code = 200
+    response.headers = {"Content-Type": content_type}
+    response.content = body
+    return response
+
+
+@patch("requests.Session.get")
+@patch("requests.Session.post")
+def test_msgpack_used_when_server_supports_it(mock_post, mock_get):
+    msgpack = pytest.importorskip("msgpack")
+    client = DeepSeekClient(api_key="test_key", wire_format="msgpack")
+    mock_get.return_value = _probe_response(
+        "application/msgpack", msgpack.packb({"data": [{"id": "model1"}]})
+    )
+    mock_post.return_value = _probe_response(
+        "application/msgpack", msgpack.packb({"choices": [{"text": "Hi"}]})
     )
+
+    response = client.generate(prompt="Test")
+
+    assert response == {"choices": [{"text": "Hi"}]}
+    assert "application/msgpack" in mock_get.call_args.kwargs["headers"]["Accept"]
+    kwargs = mock_post.call_args.kwargs
+    assert kwargs["headers"]["Content-Type"] == "application/msgpack"
+    assert msgpack.unpackb(kwargs["data"])["prompt"] == "Test"
+
+    # The probe result is cached with the model catalog.
+    other = DeepSeekClient(api_key="test_key", wire_format="msgpack")
+    other.generate(prompt="Test")
+    mock_get.assert_called_once()
+
+
+@patch("requests.Session.get")
+@patch("requests.Session.post")
+def test_msgpack_falls_back_to_json(mock_post, mock_get):
+    pytest.importorskip("msgpack")
+    client = DeepSeekClient(api_key="test_key", wire_format="msgpack")
+    mock_get.return_value = _probe_response(
+        "application/json", json.dumps({"data": []}).encode()
+    )
+    mock_post.return_value = _probe_response(
+        "application/json", json.dumps({"choices": []}).encode()
+    )
+
+    assert client.generate(prompt="Test") == {"choices": []}
+    assert mock_post.call_args.kwargs["headers"] is None
+    assert json.loads(mock_post.call_args.kwargs["data"])["prompt"] == "Test"
+
+
+def test_invalid_wire_format():
+    with pytest.raises(ValueError):
+        DeepSeekClient(api_key="test_key", wire_format="xml")